@@ -1,6 +1,127 @@
 import re
+import sys
 import json
+import threading
+from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    import requests_cache
+except ImportError:
+    requests_cache = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+if sys.version_info >= (3, 12):
+    from functools import cached_property
+else:
+    # Before Python 3.12, functools.cached_property holds one lock for all
+    # instances, which would serialize the concurrent lookups in main().
+    class cached_property:
+        """Compute an attribute once and store it on the instance."""
+
+        def __init__(self, func):
+            self.func = func
+            self.__doc__ = func.__doc__
+
+        def __set_name__(self, owner, name):
+            self.attrname = name
+
+        def __get__(self, instance, owner=None):
+            if instance is None:
+                return self
+            value = self.func(instance)
+            instance.__dict__[self.attrname] = value
+            return value
+
+# Number of concurrent requests issued against the PRIDE REST API.
+MAX_WORKERS = 16
+
+# Rewrites applied in turn to the dataset FTP link; every intermediate result
+# is a candidate location, probed concurrently by FTPDirectory.url.
+_URL_FIXES = [("", ""), ("/data/", "-"), ("pride.", "")]
+
+_PRIDE_RE = re.compile(r"^P[RX]D[0-9]{6}$")
+_PRIDE_SEARCH_RE = re.compile(r"\bP[RX]D[0-9]{6}\b")
+
+
+def _make_session():
+    """Create a pooled session for the PRIDE REST API.
+
+    If requests-cache is installed, responses are cached in a SQLite
+    database in the user cache directory and revalidated with conditional
+    requests (ETag/Last-Modified), so unchanged resources are not downloaded
+    again.
+    """
+    if requests_cache is not None:
+        session = requests_cache.CachedSession(
+            "pride_http_cache",
+            backend="sqlite",
+            use_cache_dir=True,
+            cache_control=True,
+            expire_after=3600,
+        )
+    else:
+        session = requests.Session()
+
+    retries = Retry(
+        total=3,
+        backoff_factor=0.3,
+        status_forcelist=[429, 500, 502, 503, 504],
+        # Hand the last response to our own status checks instead of
+        # raising RetryError once the retries are exhausted.
+        raise_on_status=False,
+    )
+    # Each worker in main() may have one HEAD in flight per candidate URL.
+    adapter = HTTPAdapter(
+        pool_connections=4,
+        pool_maxsize=MAX_WORKERS * len(_URL_FIXES),
+        max_retries=retries,
+    )
+    session.mount("https://", adapter)
+    return session
+
+
+_SESSION = None
+_SESSION_LOCK = threading.Lock()
+
+
+def _json_dumps(obj):
+    """Serialize an object to UTF-8 encoded JSON, preferring orjson."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj).encode("utf-8")
+
+
+def _json_loads(data):
+    """Deserialize UTF-8 encoded JSON, preferring orjson."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def get_session():
+    """The shared session used for all PRIDE REST calls.
+
+    Returns
+    -------
+    requests.Session
+        The session. Modify it to set headers, proxies, adapters, etc.
+    """
+    global _SESSION
+    if _SESSION is None:
+        with _SESSION_LOCK:
+            if _SESSION is None:
+                _SESSION = _make_session()
+    return _SESSION
+
 
 class FTPDirectory:
     """Retrieve information about a PRIDE project.
@@ -11,6 +132,9 @@ class FTPDirectory:
     ----------
     pride_id : str
         The PRIDE identifier.
+    local : str or Path object, optional
+        The local directory for this project, where the metadata is kept for
+        offline use. If omitted, nothing is written to disk.
     fetch : bool, optional
         Should ppx check the remote repository for updated metadata?
     timeout : float, optional
@@ -19,7 +143,7 @@ class FTPDirectory:
     Attributes
     ----------
     id : str
-    local : Path object
+    local : Path object or None
     url : str
     title : str
     description : str
@@ -37,11 +161,10 @@ class FTPDirectory:
     def __init__(self, pride_id, local=None, fetch=False, timeout=10.0):
         """Instantiate a PrideDataset object"""
         self.id = self._validate_id(pride_id)
+        self.local = Path(local) if local is not None else None
         self.fetch = fetch
         self.timeout = timeout
         self._rest_url = self.rest + self.id
-        self._metadata = None
-        self._url = None
 
     def _validate_id(self, identifier):
         """Validate a PRIDE identifier.
@@ -57,69 +180,87 @@ class FTPDirectory:
             The validated identifier
         """
         identifier = str(identifier).upper()
-        if not re.match("P[RX]D[0-9]{6}", identifier):
+        if not _PRIDE_RE.match(identifier):
             raise ValueError("Malformed PRIDE identifier.")
         return identifier
 
-    @property
+    @cached_property
     def url(self):
         """The FTP address associated with this project."""
-        if self._url is None:
-            links = self.metadata.get("_links", {})
-            print(links)
-            url = self.metadata["_links"]["datasetFtpUrl"]["href"]
-            print("url: " + url)
-            fixes = [("", ""), ("/data/", "-"), ("pride.", "")]
-            for fix in fixes:
-                url = url.replace(*fix)
+        url = self.metadata["_links"]["datasetFtpUrl"]["href"]
+        candidates = []
+        for fix in _URL_FIXES:
+            url = url.replace(*fix)
+            candidates.append(url)
+
+        # Probe all candidates at once, but keep their precedence.
+        candidates = list(dict.fromkeys(candidates))
+        executor = ThreadPoolExecutor(max_workers=len(candidates))
+        try:
+            futures = [executor.submit(self.test_url, c, self.timeout) for c in candidates]
+            for future in futures:
                 try:
-                    self._url = self.test_url(url)
+                    return future.result()
                 except requests.HTTPError as err:
                     last_error = err
-                    continue
-                return self._url
-            raise last_error
-        return self._url
+        finally:
+            executor.shutdown(wait=False)
+        raise last_error
 
-    @property
+    @cached_property
     def metadata(self):
         """The project metadata as a nested dictionary."""
-        if self._metadata is None:
-            metadata_file = self.local / ".pride-metadata"
-            try:
-                if metadata_file.exists():
-                    assert self.fetch
-                self._metadata = self.get(self._rest_url)
-                with metadata_file.open("w+") as ref:
-                    json.dump(self._metadata, ref)
-            except (AssertionError, requests.ConnectionError) as err:
-                if not metadata_file.exists():
-                    raise err
-                with metadata_file.open() as ref:
-                    self._metadata = json.load(ref)
-        return self._metadata
-
-    @property
+        if self.local is None:
+            return self._fetch_metadata()
+
+        metadata_file = self.local / ".pride-metadata"
+        try:
+            if metadata_file.exists():
+                assert self.fetch
+            metadata = self._fetch_metadata()
+            self.local.mkdir(parents=True, exist_ok=True)
+            metadata_file.write_bytes(_json_dumps(metadata))
+        except (AssertionError, requests.ConnectionError) as err:
+            if not metadata_file.exists():
+                raise err
+            metadata = _json_loads(metadata_file.read_bytes())
+        return metadata
+
+    def _fetch_metadata(self):
+        """Request the project metadata from PRIDE.
+
+        With ``fetch`` set, a cached response is revalidated with the server
+        instead of being reused until it expires.
+        """
+        kwargs = {"timeout": self.timeout}
+        session = get_session()
+        if self.fetch and requests_cache is not None and isinstance(
+            session, requests_cache.CachedSession
+        ):
+            kwargs["refresh"] = True
+        return self.get(self._rest_url, **kwargs)
+
+    @cached_property
     def title(self):
         """The title of this project."""
         return self.metadata["title"]
 
-    @property
+    @cached_property
     def description(self):
         """A description of this project."""
         return self.metadata["projectDescription"]
 
-    @property
+    @cached_property
     def sample_processing_protocol(self):
         """The sample processing protocol for this project."""
         return self.metadata["sampleProcessingProtocol"]
 
-    @property
+    @cached_property
     def data_processing_protocol(self):
         """The data processing protocol for this project."""
         return self.metadata["dataProcessingProtocol"]
 
-    @property
+    @cached_property
     def doi(self):
         """The DOI for this project."""
         return self.metadata["doi"]
@@ -127,15 +268,15 @@ class FTPDirectory:
     @staticmethod
     def get(url, **kwargs):
         """Perform a GET command at the specified url."""
-        res = requests.get(url, **kwargs)
+        res = get_session().get(url, **kwargs)
         if res.status_code != 200:
             raise requests.HTTPError(f"Error {res.status_code}: {res.text}")
         return res.json()
 
     @staticmethod
-    def test_url(url):
+    def test_url(url, timeout=None):
         """Test the accessibility of a URL."""
-        res = requests.head(url)
+        res = get_session().head(url, allow_redirects=True, timeout=timeout)
         res.raise_for_status()
         return url
 
@@ -153,34 +294,36 @@ def list_projects(timeout=10.0):
     Returns
     -------
     list of str
-        A list of PRIDE identifiers.
+        A sorted list of unique PRIDE identifiers.
     """
     url = "https://www.ebi.ac.uk/pride/ws/archive/v2/misc/sitemap"
-    res = requests.get(url, timeout=timeout)
+    res = get_session().get(url, timeout=timeout)
     if res.status_code != 200:
         raise requests.HTTPError(f"Error {res.status_code}: {res.text})")
-    res = [p.split("/")[-1] for p in res.text.splitlines()]
-    projects = [p for p in res if re.match("P[RX]D[0-9]{6}", p)]
-    projects.sort()
-    return projects
+    return sorted(set(_PRIDE_SEARCH_RE.findall(res.text)))
 
-def main():
+def main(max_workers=MAX_WORKERS):
     # Get a list of PRIDE project identifiers
     project_identifiers = list_projects()
 
-    # Iterate over each project identifier
-    for identifier in project_identifiers:
-        try:
-            # Instantiate a FTPDirectory object for the current identifier
-            project = FTPDirectory(identifier)
+    # Resolve the FTP locations concurrently over the shared session
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = {
+            executor.submit(lambda p: (p.id, p.url), FTPDirectory(i)): i
+            for i in project_identifiers
+        }
+        for future in as_completed(futures):
+            identifier = futures[future]
+            try:
+                _, url = future.result()
 
-            # Print the project identifier and its associated FTP location
-            print(f"Project: {identifier}")
-            print(f"FTP Location: {project.url}")
-            print()
+                # Print the project identifier and its associated FTP location
+                print(f"Project: {identifier}")
+                print(f"FTP Location: {url}")
+                print()
 
-        except Exception as e:
-            print(f"Error processing project {identifier}: {e}")
+            except Exception as e:
+                print(f"Error processing project {identifier}: {e}")
 
 if __name__ == "__main__":
     main()
@@ -1,124 +1,809 @@
-from ftplib import FTP
+from concurrent.futures import ThreadPoolExecutor
+from collections import OrderedDict
+from contextlib import contextmanager
+from ftplib import FTP, all_errors, error_perm, error_reply, error_temp
+import asyncio
+import csv
 import os
+import posixpath
 import gzip
 import pickle
+import queue
+import sys
+import threading
+import time
+import zlib
+
+try:
+    import aioftp
+except ImportError:
+    aioftp = None
+
+# Errors after which an FTP connection cannot be trusted any more; a
+# permanent error reply (e.g. 550) leaves the connection usable
+_CONNECTION_ERRORS = (OSError, EOFError, error_temp, error_reply)
+
+# Facts requested from the server for MLSD directory listings
+MLSD_FACTS = ["type", "size", "modify"]
+
+# Block size for FTP transfers; larger blocks mean fewer recv/write calls
+BLOCK_SIZE = 1 << 20
+
+# File name suffixes for the supported download formats
+FILE_FORMAT_SUFFIXES = {"raw": ".raw", "mgf": ".mgf", "mgf.gz": ".mgf.gz"}
+
+
+def _filter_entries(listing, entry_type):
+    """
+    Keeps the entries of one type from a directory listing.
+
+    Args:
+        listing (list): (name, facts) pairs.
+        entry_type (str): The type fact to keep, e.g. "dir" or "file".
+
+    Returns:
+        dict: Dictionary mapping entry names to their facts.
+    """
+    return {name: facts for name, facts in listing if facts.get("type") == entry_type}
+
+
+def _traversed_years(years):
+    """
+    Selects the years whose datasets are listed.
+
+    Args:
+        years (list): The year directories on the server.
+
+    Returns:
+        list: The selected years, interned since they repeat across many datasets.
+    """
+    return [sys.intern(year) for year in years if year == '2010']
+
+
+def _year_indices(year, indices):
+    """
+    Pairs a year with each of its indices.
+
+    Args:
+        year (str): The year, as returned by _traversed_years().
+        indices (iterable): The index directories of that year.
+
+    Returns:
+        list: (year, index) tuples with interned index strings.
+    """
+    return [(year, sys.intern(index)) for index in indices]
+
+
+def _new_dataset_paths(prefix):
+    """
+    Creates an empty dataset_paths dictionary.
+
+    Paths are stored as {"prefix": ftp_path, "entries": {dataset: (year, index)}}
+    so the long common prefix is kept only once.
+
+    Args:
+        prefix (str): The base path on the FTP server.
+
+    Returns:
+        dict: The dataset_paths dictionary without entries.
+    """
+    return {"prefix": prefix, "entries": {}}
+
+
+def _add_datasets(dataset_paths, year_index, datasets):
+    """
+    Records the datasets found in one index directory.
+
+    Args:
+        dataset_paths (dict): The dataset_paths dictionary to update.
+        year_index (tuple): The (year, index) tuple shared by the datasets.
+        datasets (iterable): The dataset identifiers.
+    """
+    entries = dataset_paths["entries"]
+    for dataset in datasets:
+        entries[dataset] = year_index
+
+
+def _dataset_path(dataset_paths, dataset_identifier):
+    """
+    Reconstructs the full remote path of a dataset.
+
+    Args:
+        dataset_paths (dict): The dataset_paths dictionary.
+        dataset_identifier (str): The PX dataset identifier (e.g., PXD123456).
+
+    Returns:
+        str: The full path on the FTP server, or None if the dataset is unknown.
+    """
+    entry = dataset_paths["entries"].get(dataset_identifier)
+    if entry is None:
+        return None
+    year, index = entry
+    return posixpath.join(dataset_paths["prefix"], year, index, dataset_identifier)
+
+
+def _file_suffix(file_format):
+    """
+    Looks up the file name suffix of a download format.
+
+    Args:
+        file_format (str): The file format ("raw", "mgf", or "mgf.gz").
+
+    Returns:
+        str: The suffix of matching files.
+    """
+    suffix = FILE_FORMAT_SUFFIXES.get(file_format.lower())
+    if suffix is None:
+        raise ValueError("Invalid file format. Choose 'raw', 'mgf', or 'mgf.gz'.")
+    return suffix
+
+
+def _generated_locations(dataset_path, local_directory, listing):
+    """
+    Looks for the "generated" subdirectory of a dataset.
+
+    Args:
+        dataset_path (str): The full remote path of the dataset.
+        local_directory (str): The local directory of the dataset.
+        listing (list): (name, facts) pairs of the dataset directory.
+
+    Returns:
+        tuple: (remote_directory, local_base) of the subdirectory, or None if the dataset has none.
+    """
+    for name, facts in listing:
+        if name.lower() == "generated" and facts.get("type") == "dir":
+            return posixpath.join(dataset_path, name), os.path.join(local_directory, name)
+    return None
+
+
+def _plan_transfers(files, suffix, remote_directory, local_base, decompress):
+    """
+    Selects the files to download and pairs them with their local targets.
+
+    Args:
+        files (dict): Dictionary mapping remote file names to their facts.
+        suffix (str): The suffix of the files to download.
+        remote_directory (str): The remote directory holding the files.
+        local_base (str): The local directory receiving the files.
+        decompress (bool): Whether ".gz" files are decompressed while downloading.
+
+    Returns:
+        list: (size, (remote_path, local_filename, gunzip)) pairs. Remote paths are absolute.
+    """
+    sized_transfers = []
+    for remote_filename, facts in files.items():
+        if not remote_filename.lower().endswith(suffix):
+            continue
+        local_filename = os.path.join(local_base, remote_filename)
+        remote_path = posixpath.join(remote_directory, remote_filename)
+        gunzip = decompress and local_filename.lower().endswith(".gz")
+        if gunzip:
+            local_filename = local_filename[:-len(".gz")]
+        size = int(facts.get("size", 0))
+        sized_transfers.append((size, (remote_path, local_filename, gunzip)))
+    return sized_transfers
+
+
+async def _gather_or_cancel(awaitables):
+    """
+    Runs awaitables concurrently; if one fails, cancels the others and waits for them.
+
+    Args:
+        awaitables (iterable): The coroutines to run.
+
+    Returns:
+        list: Their results, in order.
+    """
+    tasks = [asyncio.ensure_future(aw) for aw in awaitables]
+    try:
+        return await asyncio.gather(*tasks)
+    except BaseException:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        raise
+
+
+def _retrieve(ftp, remote_path, sink, blocksize=BLOCK_SIZE):
+    """
+    Downloads a remote file into a sink, reading the data socket directly.
+
+    Unlike FTP.retrbinary, no new bytes object and no Python callback are
+    needed per block: data is received into one reusable buffer.
+
+    Args:
+        ftp (FTP): A logged-in FTP connection.
+        remote_path (str): The full path of the remote file.
+        sink (file): Object whose write() accepts a memoryview of each block.
+    """
+    buffer = bytearray(blocksize)
+    view = memoryview(buffer)
+    ftp.voidcmd("TYPE I")
+    with ftp.transfercmd(f"RETR {remote_path}") as conn:
+        while True:
+            n_bytes = conn.recv_into(buffer)
+            if not n_bytes:
+                break
+            sink.write(view[:n_bytes])
+    ftp.voidresp()
+
+
+def _drop_from_page_cache(local_file):
+    """
+    Writes a finished file to disk and evicts it from the page cache.
+
+    Large raw files are written once and not read again, so caching them
+    only pushes out more useful pages. The kernel keeps dirty pages, hence
+    the data is flushed and synced before the hint is given.
+
+    Args:
+        local_file (file): The open binary file.
+    """
+    if not hasattr(os, "posix_fadvise"):
+        return
+    local_file.flush()
+    os.fdatasync(local_file.fileno())
+    os.posix_fadvise(local_file.fileno(), 0, 0, os.POSIX_FADV_DONTNEED)
+
+
+class _GunzipWriter:
+    def __init__(self, local_file):
+        """
+        Decompresses gzip data chunk by chunk into a file.
+
+        Args:
+            local_file (file): The binary file receiving the decompressed data.
+        """
+        self.local_file = local_file
+        self._decompressor = None  # Decompressor of the current gzip member
+
+    def write(self, chunk):
+        """
+        Decompresses a chunk and writes the result.
+
+        Args:
+            chunk (bytes): The next piece of the compressed stream.
+        """
+        while chunk:
+            if self._decompressor is None:
+                # Between members: skip NUL padding, as gzip.decompress does
+                chunk = bytes(chunk).lstrip(b"\x00")
+                if not chunk:
+                    break
+                self._decompressor = zlib.decompressobj(wbits=31)  # Expect a gzip header
+            self.local_file.write(self._decompressor.decompress(chunk))
+            if not self._decompressor.eof:
+                break
+            # Concatenated gzip members: start over on the remaining bytes
+            chunk = self._decompressor.unused_data
+            self._decompressor = None
+
+    def close(self):
+        """
+        Checks that the compressed stream ended with a complete member.
+
+        Raises:
+            EOFError: If the stream was truncated.
+        """
+        if self._decompressor is not None:
+            raise EOFError("Compressed file ended before the end-of-stream marker was reached")
+
+
+class FTPConnectionPool:
+    def __init__(self, ftp_host, max_connections=4, idle_check=15.0):
+        """
+        Initializes a pool of logged-in FTP connections to a single host.
+
+        Connections are opened lazily, up to max_connections, and handed out
+        to one thread at a time.
+
+        Args:
+            ftp_host (str): The FTP server hostname.
+            max_connections (int, optional): Maximum number of concurrent connections. Defaults to 4.
+            idle_check (float, optional): Seconds of idleness after which a connection is checked with NOOP before reuse. Defaults to 15.
+        """
+        self.ftp_host = ftp_host
+        self.max_connections = max_connections
+        self.idle_check = idle_check
+        self._idle = queue.Queue()  # (ftp, released_at), or None for a freed slot
+        self._opened = 0
+        self._lock = threading.Lock()
+
+    def _open(self):
+        """
+        Opens a new FTP connection.
+
+        Returns:
+            FTP: A logged-in FTP connection in passive mode.
+        """
+        ftp = FTP(self.ftp_host)
+        ftp.login()
+        ftp.set_pasv(True)  # Use passive mode
+        return ftp
+
+    def _is_alive(self, ftp, released_at):
+        """
+        Checks whether an idle connection can still be used.
+
+        Args:
+            ftp (FTP): An idle connection.
+            released_at (float): The time.monotonic() at which it was released.
+
+        Returns:
+            bool: False if the server has closed the connection.
+        """
+        if time.monotonic() - released_at < self.idle_check:
+            return True
+        try:
+            ftp.voidcmd("NOOP")
+            return True
+        except all_errors:
+            return False
+
+    def acquire(self):
+        """
+        Checks out a connection, blocking until one is available.
+
+        Idle connections the server has meanwhile closed are replaced.
+
+        Returns:
+            FTP: A logged-in FTP connection.
+        """
+        while True:
+            try:
+                item = self._idle.get_nowait()
+            except queue.Empty:
+                with self._lock:
+                    can_open = self._opened < self.max_connections
+                    if can_open:
+                        self._opened += 1
+                if can_open:
+                    try:
+                        return self._open()
+                    except Exception:
+                        self._free_slot()
+                        raise
+                item = self._idle.get()
+
+            if item is None:
+                continue  # A discarded connection freed a slot
+            ftp, released_at = item
+            if self._is_alive(ftp, released_at):
+                return ftp
+            self.discard(ftp)
+
+    def release(self, ftp):
+        """
+        Returns a connection to the pool.
+
+        Args:
+            ftp (FTP): A connection obtained from acquire().
+        """
+        self._idle.put((ftp, time.monotonic()))
+
+    def discard(self, ftp):
+        """
+        Closes a broken connection instead of returning it to the pool.
+
+        Args:
+            ftp (FTP): A connection obtained from acquire().
+        """
+        ftp.close()
+        self._free_slot()
+
+    def _free_slot(self):
+        """
+        Frees the slot of a closed connection and wakes up a waiting thread.
+        """
+        with self._lock:
+            self._opened -= 1
+        self._idle.put(None)
+
+    @contextmanager
+    def connection(self):
+        """
+        Checks out a connection for the duration of a with block.
+
+        Permanent FTP error replies (e.g. 550) leave the connection usable.
+        Any other exception, including a 421 closing reply, may have left the
+        connection closed or with a transfer reply still unread, so the
+        connection is discarded.
+        """
+        ftp = self.acquire()
+        try:
+            yield ftp
+        except error_perm:
+            self.release(ftp)
+            raise
+        except BaseException:
+            self.discard(ftp)
+            raise
+        else:
+            self.release(ftp)
+
+    def close(self):
+        """
+        Closes all idle connections.
+        """
+        while True:
+            try:
+                item = self._idle.get_nowait()
+            except queue.Empty:
+                break
+            if item is None:
+                continue
+            ftp, _ = item
+            try:
+                ftp.quit()
+            except all_errors:
+                ftp.close()
+            with self._lock:
+                self._opened -= 1
+
+
+class ListingCache:
+    def __init__(self, maxsize=1024, ttl=300.0):
+        """
+        Initializes a thread-safe LRU cache of directory listings with expiry.
+
+        Args:
+            maxsize (int, optional): Maximum number of cached directories. Defaults to 1024.
+            ttl (float, optional): Seconds after which a listing is fetched again. Defaults to 300.
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries = OrderedDict()  # path -> (timestamp, listing)
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _key(path):
+        return posixpath.normpath(path)
+
+    def get(self, path):
+        """
+        Looks up the listing of a directory.
+
+        Args:
+            path (str): The remote directory.
+
+        Returns:
+            list: The cached listing, or None if absent or expired.
+        """
+        key = self._key(path)
+        with self._lock:
+            item = self._entries.get(key)
+            if item is None:
+                return None
+            timestamp, listing = item
+            if time.monotonic() - timestamp > self.ttl:
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return listing
+
+    def put(self, path, listing):
+        """
+        Stores the listing of a directory, evicting the least recently used one if full.
+
+        Args:
+            path (str): The remote directory.
+            listing (list): The directory listing.
+        """
+        key = self._key(path)
+        with self._lock:
+            self._entries[key] = (time.monotonic(), listing)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, path=None):
+        """
+        Drops the cached listings of a directory and everything below it.
+
+        Args:
+            path (str, optional): The remote directory. Defaults to None, which clears the whole cache.
+        """
+        with self._lock:
+            if path is None:
+                self._entries.clear()
+                return
+            key = self._key(path)
+            prefix = key.rstrip("/") + "/"
+            for cached in [k for k in self._entries if k == key or k.startswith(prefix)]:
+                del self._entries[cached]
+
 
 class PRIDEUtility:
-    def __init__(self, ftp_host, ftp_path):
+    def __init__(self, ftp_host, ftp_path, max_connections=4, listing_ttl=300.0, listing_cache_size=1024):
         """
         Initializes the PRIDEUtility class.
 
         Args:
             ftp_host (str): The FTP server hostname.
             ftp_path (str): The base path on the FTP server.
+            max_connections (int, optional): Number of concurrent FTP connections used for bulk operations. Defaults to 4.
+            listing_ttl (float, optional): Seconds for which directory listings are served from memory. Defaults to 300.
+            listing_cache_size (int, optional): Maximum number of cached directory listings. Defaults to 1024.
         """
         self.ftp_host = ftp_host
         self.ftp_path = ftp_path
-        self.dataset_paths = None  # Dictionary to store dataset paths
+        self.max_connections = max_connections
+        self.dataset_paths = None  # Common prefix and per-dataset (year, index) entries
+        self._ftp = None  # Persistent FTP control connection
+        self._pool = None  # Pool of FTP connections for parallel work
+        self._listing_cache = ListingCache(listing_cache_size, listing_ttl)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def _connect(self):
+        """
+        Returns the persistent FTP connection, connecting if needed.
+
+        Returns:
+            FTP: A logged-in FTP connection in passive mode.
+        """
+        if self._ftp is not None:
+            return self._ftp
+
+        ftp = FTP(self.ftp_host)
+        ftp.login()
+        ftp.set_pasv(True)  # Use passive mode
+        self._ftp = ftp
+        return ftp
+
+    def _get_pool(self):
+        """
+        Returns the FTP connection pool, creating it on first use.
+
+        Returns:
+            FTPConnectionPool: The connection pool.
+        """
+        if self._pool is None:
+            self._pool = FTPConnectionPool(self.ftp_host, self.max_connections)
+        return self._pool
+
+    def _mlsd(self, path):
+        """
+        Lists a remote directory using MLSD on the persistent connection,
+        served from the listing cache if possible.
+
+        Args:
+            path (str): The remote directory.
+
+        Returns:
+            list: (name, facts) pairs.
+        """
+        listing = self._listing_cache.get(path)
+        if listing is None:
+            try:
+                listing = list(self._connect().mlsd(path, facts=MLSD_FACTS))
+            except _CONNECTION_ERRORS:
+                # Most likely the server dropped the idle connection: drop
+                # only the listing connection (the pool stays in use) and retry
+                if self._ftp is not None:
+                    self._ftp.close()
+                    self._ftp = None
+                listing = list(self._connect().mlsd(path, facts=MLSD_FACTS))
+            self._listing_cache.put(path, listing)
+        return listing
+
+    def _list_entries(self, path, entry_type):
+        """
+        Lists the entries of one type in a remote directory.
+
+        Args:
+            path (str): The remote directory.
+            entry_type (str): The MLSD type fact to keep, e.g. "dir" or "file".
+
+        Returns:
+            dict: Dictionary mapping entry names to their MLSD facts.
+        """
+        return _filter_entries(self._mlsd(path), entry_type)
+
+    def _pooled_list_dirs(self, path):
+        """
+        Lists the subdirectories of a directory on a pooled connection,
+        served from the listing cache if possible.
+
+        Args:
+            path (str): The remote directory.
+
+        Returns:
+            list: The names of the subdirectories.
+        """
+        # Look up once: a second lookup could miss after expiry or eviction
+        # and fall back to the persistent connection from this worker thread
+        listing = self._listing_cache.get(path)
+        if listing is None:
+            with self._get_pool().connection() as ftp:
+                listing = list(ftp.mlsd(path, facts=MLSD_FACTS))
+            self._listing_cache.put(path, listing)
+        return list(_filter_entries(listing, "dir"))
+
+    def invalidate(self, path=None):
+        """
+        Forgets cached directory listings so they are fetched again.
+
+        Args:
+            path (str, optional): The remote directory whose subtree to forget. Defaults to None, which forgets all listings.
+        """
+        self._listing_cache.invalidate(path)
+
+    def close(self):
+        """
+        Closes the persistent FTP connection and the connection pool, if open.
+        """
+        if self._ftp is not None:
+            try:
+                self._ftp.quit()
+            except all_errors:
+                self._ftp.close()
+            self._ftp = None
+        if self._pool is not None:
+            self._pool.close()
+            self._pool = None
 
-    
     def _load_dataset_paths(self):
         """
         Lazy-loads the dataset paths and creates the dataset_paths dictionary.
         """
         if self.dataset_paths is None:
-            self.dataset_paths = {}
-            with FTP(self.ftp_host) as ftp:
-                try:
-                    ftp.login()
-                    ftp.cwd(self.ftp_path)
-                    years = ftp.nlst()
-                    for year in years:
-                        if year == '2010':                            
-                            year_path = f"{self.ftp_path}/{year}"
-                            indices = ftp.nlst(year_path)
-                            for index in indices:
-                                index_path = index
-                                datasets = ftp.nlst(index_path)
-                                for dataset in datasets:
-                                    dataset_path = dataset
-                                    self.dataset_paths[os.path.basename(dataset)] = dataset_path
-                except Exception as e:
-                    print(f"Error listing datasets: {str(e)}")
+            self.dataset_paths = _new_dataset_paths(self.ftp_path)
+            try:
+                year_indices = []
+                for year in _traversed_years(self.list_years()):
+                    year_path = posixpath.join(self.ftp_path, year)
+                    year_indices.extend(_year_indices(year, self.list_indices(year_path)))
+
+                # List the indices concurrently over the connection pool
+                index_paths = [posixpath.join(self.ftp_path, year, index) for year, index in year_indices]
+                with ThreadPoolExecutor(max_workers=self.max_connections) as executor:
+                    listings = executor.map(self._pooled_list_dirs, index_paths)
+                    for year_index, datasets in zip(year_indices, listings):
+                        _add_datasets(self.dataset_paths, year_index, datasets)
+            except Exception as e:
+                print(f"Error listing datasets: {str(e)}")
 
     def list_datasets(self):
         """
-        Lists available datasets and their full paths.
+        Lists available datasets and their locations.
 
         Returns:
-            dict: Dictionary mapping dataset identifiers to full paths.
+            dict: Dictionary with the common path "prefix" and "entries" mapping dataset identifiers to (year, index) tuples.
         """
         self._load_dataset_paths()  # Lazy load dataset paths
         return self.dataset_paths
 
-    def download_dataset(self, dataset_identifier, file_format="raw"):
+    def dataset_path(self, dataset_identifier):
+        """
+        Reconstructs the full remote path of a dataset.
+
+        Args:
+            dataset_identifier (str): The PX dataset identifier (e.g., PXD123456).
+
+        Returns:
+            str: The full path on the FTP server, or None if the dataset is unknown.
+        """
+        return _dataset_path(self.dataset_paths, dataset_identifier)
+
+    def download_dataset(self, dataset_identifier, file_format="raw", decompress=False):
         """
         Downloads all files of the specified dataset in the given file format.
 
         Args:
             dataset_identifier (str): The PX dataset identifier (e.g., PXD123456).
             file_format (str): Optional. The desired file format ("raw", "mgf", or "mgf.gz").
+            decompress (bool): Optional. Decompress ".gz" files while they are downloaded, storing them without the ".gz" suffix. Defaults to False.
 
         Returns:
             bool: True if download is successful, False otherwise.
         """      
-        dataset_path = self.dataset_paths.get(dataset_identifier)
+        dataset_path = self.dataset_path(dataset_identifier)
 
         if not dataset_path:
             print(f"Dataset {dataset_identifier} not found.")
             return False
 
         local_directory = dataset_identifier
-        os.makedirs(local_directory, exist_ok=True)  # Create local directory if not exists
 
-        with FTP(self.ftp_host) as ftp:
-            try:
-                ftp.login()
-                ftp.set_pasv(True)  # Use passive mode
-
-                # Check if the "generated" subdirectory exists
-                generated_subdirectory = os.path.join(dataset_path, "generated").replace("\\", "/")
-                
-                all_files = ftp.nlst(dataset_path)
-                for file in all_files: 
-                    if file.lower().endswith("generated"):
-                        ftp.cwd(generated_subdirectory)
-                        # List all files in the "generated" subdirectory                        
-                        files = ftp.nlst()                
-                    else:
-                        # List all files in the main directory
-                        files = all_files                                
-            
-                if file_format.lower() == "raw":
-                    filtered_files = [f for f in files if f.lower().endswith(".raw")]
-                elif file_format.lower() == "mgf":
-                    filtered_files = [f for f in files if f.lower().endswith(".mgf")]
-                elif file_format.lower() == "mgf.gz":
-                    filtered_files = [f for f in files if f.lower().endswith(".mgf.gz")]                    
-                else:
-                    raise ValueError("Invalid file format. Choose 'raw', 'mgf', or 'mgf.gz'.")
-
-                for remote_filename in filtered_files:
-                    local_filename = os.path.join(local_directory, "generated", remote_filename) if "generated" in all_files else os.path.join(local_directory, remote_filename)
-                    with open(local_filename, "wb") as local_file:
-                        ftp.retrbinary(f"RETR {remote_filename}", local_file.write)
+        try:
+            suffix = _file_suffix(file_format)
 
-                return True
-            except Exception as e:
-                print(f"Error downloading dataset {dataset_identifier}: {str(e)}")
+            # Prefer the "generated" subdirectory if it holds matching files.
+            # Pooled connections do not share our working directory, so
+            # every transfer carries the file's absolute remote path
+            entries = self._mlsd(dataset_path)
+            sized_transfers = []
+            generated = _generated_locations(dataset_path, local_directory, entries)
+            if generated is not None:
+                remote_directory, local_base = generated
+                files = self._list_entries(remote_directory, "file")
+                sized_transfers = _plan_transfers(files, suffix, remote_directory, local_base, decompress)
+            if not sized_transfers:
+                local_base = local_directory
+                files = _filter_entries(entries, "file")
+                sized_transfers = _plan_transfers(files, suffix, dataset_path, local_base, decompress)
+            if not sized_transfers:
+                print(f"No {file_format} files found in dataset {dataset_identifier}.")
                 return False
 
+            os.makedirs(local_base, exist_ok=True)  # Create local directory if not exists
+
+            # Download the batches concurrently, one pooled connection each;
+            # a failed batch stops the others before their next file
+            batches = self._partition_transfers(sized_transfers)
+            failed = threading.Event()
+            with ThreadPoolExecutor(max_workers=max(len(batches), 1)) as executor:
+                list(executor.map(self._download_batch, batches, [failed] * len(batches)))
+
+            return True
+        except Exception as e:
+            print(f"Error downloading dataset {dataset_identifier}: {str(e)}")
+            return False
+
+    def _partition_transfers(self, sized_transfers):
+        """
+        Splits transfers into size-balanced batches, one per pooled connection.
+
+        Files are assigned largest first to the currently lightest batch.
+
+        Args:
+            sized_transfers (list): (size, (remote_path, local_filename, gunzip)) pairs.
+
+        Returns:
+            list: A list of non-empty batches of transfers.
+        """
+        sized = sorted(sized_transfers, key=lambda item: item[0], reverse=True)
+
+        n_batches = min(self.max_connections, len(sized))
+        batches = [[] for _ in range(n_batches)]
+        loads = [0] * n_batches
+        for size, transfer in sized:
+            lightest = loads.index(min(loads))
+            batches[lightest].append(transfer)
+            loads[lightest] += size
+        return batches
+
+    def _download_batch(self, batch, failed):
+        """
+        Downloads a batch of files on a connection checked out from the pool.
+
+        Args:
+            batch (list): (remote_path, local_filename, gunzip) tuples.
+            failed (threading.Event): Shared by all batches of a download; set on the first failure, after which the remaining files are skipped.
+        """
+        if failed.is_set():
+            return
+        try:
+            with self._get_pool().connection() as ftp:
+                for remote_path, local_filename, gunzip in batch:
+                    if failed.is_set():
+                        return
+                    # Buffered: the writer retries short writes before the receive buffer is reused
+                    with open(local_filename, "wb") as local_file:
+                        if gunzip:
+                            writer = _GunzipWriter(local_file)
+                            _retrieve(ftp, remote_path, writer)
+                            writer.close()
+                        else:
+                            _retrieve(ftp, remote_path, local_file)
+                        _drop_from_page_cache(local_file)
+        except BaseException:
+            failed.set()
+            raise
+
     def list_years(self):
         """
-        Connects to the FTP server and lists available years (subdirectories).
+        Lists available years (subdirectories) on the FTP server.
 
         Returns:
             list: A list of available years.
         """
-        with FTP(self.ftp_host) as ftp:
-            ftp.login()
-            ftp.cwd(self.ftp_path)
-            return ftp.nlst()
+        return list(self._list_entries(self.ftp_path, "dir"))
 
     def list_indices(self, year_path):
         """
@@ -130,10 +815,7 @@ class PRIDEUtility:
         Returns:
             list: A list of available indices.
         """
-        with FTP(self.ftp_host) as ftp:
-            ftp.login()
-            ftp.cwd(year_path)
-            return ftp.nlst()
+        return list(self._list_entries(year_path, "dir"))
 
 
     def write_datasets_to_csv(self, datasets, csv_filename="datasets_list.csv"):
@@ -144,38 +826,237 @@ class PRIDEUtility:
             datasets (list): List of dataset names.
             csv_filename (str, optional): Name of the CSV file. Defaults to "datasets_list.csv".
         """
-        with open(csv_filename, mode='w', newline='') as csv_file:
-            fieldnames = ['Dataset']
-            writer = csv.DictWriter(csv_file, fieldnames=fieldnames)
-            writer.writeheader()
-
-            for dataset in datasets:
-                writer.writerow({'Dataset': dataset})
+        with open(csv_filename, mode='w', newline='', buffering=1 << 20) as csv_file:
+            writer = csv.writer(csv_file)
+            writer.writerow(['Dataset'])
+            writer.writerows([dataset] for dataset in datasets)
 
         print(f"Dataset list has been written to {csv_filename}")
 
 
+class AsyncPRIDEUtility:
+    def __init__(self, ftp_host, ftp_path, max_connections=16):
+        """
+        Initializes the AsyncPRIDEUtility class, an asyncio variant of PRIDEUtility.
+
+        Every listing and download runs on its own aioftp connection, so many
+        directories can be traversed concurrently without a thread per connection.
+
+        Args:
+            ftp_host (str): The FTP server hostname.
+            ftp_path (str): The base path on the FTP server.
+            max_connections (int, optional): Maximum number of simultaneous FTP connections. Defaults to 16.
+        """
+        if aioftp is None:
+            raise ImportError("AsyncPRIDEUtility requires the aioftp package.")
+        self.ftp_host = ftp_host
+        self.ftp_path = ftp_path
+        self.max_connections = max_connections
+        self.dataset_paths = None  # Common prefix and per-dataset (year, index) entries
+        self._semaphore = None
+        self._semaphore_loop = None
+
+    def _connection_slots(self):
+        """
+        Returns the semaphore limiting the connections of the running event loop.
+
+        An asyncio.Semaphore is bound to the loop it is first used in, so a
+        new one is created whenever the instance is used from another loop,
+        e.g. by a second asyncio.run().
+
+        Returns:
+            asyncio.Semaphore: The semaphore with max_connections slots.
+        """
+        loop = asyncio.get_running_loop()
+        if self._semaphore_loop is not loop:
+            self._semaphore = asyncio.Semaphore(self.max_connections)
+            self._semaphore_loop = loop
+        return self._semaphore
+
+    async def _list(self, path):
+        """
+        Lists a remote directory on a fresh connection.
+
+        Args:
+            path (str): The remote directory.
+
+        Returns:
+            list: (name, info) pairs, where info holds the "type" and "size" facts.
+        """
+        async with self._connection_slots():
+            async with aioftp.Client.context(self.ftp_host) as client:
+                listing = await client.list(path)
+        return [(entry.name, info) for entry, info in listing]
+
+    async def _list_entries(self, path, entry_type):
+        """
+        Lists the entries of one type in a remote directory.
+
+        Args:
+            path (str): The remote directory.
+            entry_type (str): The type to keep, e.g. "dir" or "file".
+
+        Returns:
+            dict: Dictionary mapping entry names to their facts.
+        """
+        return _filter_entries(await self._list(path), entry_type)
+
+    async def list_years(self):
+        """
+        Lists available years (subdirectories) on the FTP server.
+
+        Returns:
+            list: A list of available years.
+        """
+        return list(await self._list_entries(self.ftp_path, "dir"))
+
+    async def list_indices(self, year_path):
+        """
+        Lists available indices (subdirectories) within a given year.
+
+        Args:
+            year_path (str): The path to the year directory.
+
+        Returns:
+            list: A list of available indices.
+        """
+        return list(await self._list_entries(year_path, "dir"))
+
+    async def list_datasets(self):
+        """
+        Lists available datasets and their locations, listing all indices concurrently.
+
+        Returns:
+            dict: Dictionary with the common path "prefix" and "entries" mapping dataset identifiers to (year, index) tuples.
+        """
+        if self.dataset_paths is None:
+            self.dataset_paths = _new_dataset_paths(self.ftp_path)
+            try:
+                year_indices = []
+                for year in _traversed_years(await self.list_years()):
+                    year_path = posixpath.join(self.ftp_path, year)
+                    year_indices.extend(_year_indices(year, await self.list_indices(year_path)))
+
+                listings = await _gather_or_cancel(
+                    self._list_entries(posixpath.join(self.ftp_path, year, index), "dir")
+                    for year, index in year_indices
+                )
+                for year_index, datasets in zip(year_indices, listings):
+                    _add_datasets(self.dataset_paths, year_index, datasets)
+            except Exception as e:
+                print(f"Error listing datasets: {str(e)}")
+        return self.dataset_paths
+
+    def dataset_path(self, dataset_identifier):
+        """
+        Reconstructs the full remote path of a dataset.
+
+        Args:
+            dataset_identifier (str): The PX dataset identifier (e.g., PXD123456).
+
+        Returns:
+            str: The full path on the FTP server, or None if the dataset is unknown.
+        """
+        return _dataset_path(self.dataset_paths, dataset_identifier)
+
+    async def download_dataset(self, dataset_identifier, file_format="raw", decompress=False):
+        """
+        Downloads all files of the specified dataset in the given file format, concurrently.
+
+        Args:
+            dataset_identifier (str): The PX dataset identifier (e.g., PXD123456).
+            file_format (str): Optional. The desired file format ("raw", "mgf", or "mgf.gz").
+            decompress (bool): Optional. Decompress ".gz" files while they are downloaded, storing them without the ".gz" suffix. Defaults to False.
+
+        Returns:
+            bool: True if download is successful, False otherwise.
+        """
+        dataset_path = self.dataset_path(dataset_identifier)
+
+        if not dataset_path:
+            print(f"Dataset {dataset_identifier} not found.")
+            return False
+
+        local_directory = dataset_identifier
+
+        try:
+            suffix = _file_suffix(file_format)
+
+            # Prefer the "generated" subdirectory if it holds matching files
+            entries = await self._list(dataset_path)
+            sized_transfers = []
+            generated = _generated_locations(dataset_path, local_directory, entries)
+            if generated is not None:
+                remote_directory, local_base = generated
+                files = await self._list_entries(remote_directory, "file")
+                sized_transfers = _plan_transfers(files, suffix, remote_directory, local_base, decompress)
+            if not sized_transfers:
+                local_base = local_directory
+                files = _filter_entries(entries, "file")
+                sized_transfers = _plan_transfers(files, suffix, dataset_path, local_base, decompress)
+            if not sized_transfers:
+                print(f"No {file_format} files found in dataset {dataset_identifier}.")
+                return False
+
+            os.makedirs(local_base, exist_ok=True)  # Create local directory if not exists
+
+            # Stop the remaining downloads as soon as one fails
+            await _gather_or_cancel(
+                self._download_file(*transfer) for _, transfer in sized_transfers
+            )
+
+            return True
+        except Exception as e:
+            print(f"Error downloading dataset {dataset_identifier}: {str(e)}")
+            return False
+
+    async def _download_file(self, remote_path, local_filename, gunzip):
+        """
+        Streams one remote file to disk on a fresh connection.
+
+        Args:
+            remote_path (str): The full path of the remote file.
+            local_filename (str): The local target file.
+            gunzip (bool): Whether to decompress the gzip stream on the fly.
+        """
+        async with self._connection_slots():
+            async with aioftp.Client.context(self.ftp_host) as client:
+                async with client.download_stream(remote_path) as stream:
+                    # Disk writes and decompression run in worker threads so
+                    # they do not stall the other transfers on the event loop.
+                    # Buffered: a raw FileIO may write only part of a block
+                    local_file = await asyncio.to_thread(open, local_filename, "wb")
+                    try:
+                        writer = _GunzipWriter(local_file) if gunzip else local_file
+                        async for block in stream.iter_by_block(BLOCK_SIZE):
+                            await asyncio.to_thread(writer.write, block)
+                        if gunzip:
+                            await asyncio.to_thread(writer.close)
+                    finally:
+                        await asyncio.to_thread(local_file.close)
+
+
 if __name__ == "__main__":
     # Set FTP server details
     ftp_host = "ftp.pride.ebi.ac.uk"
     ftp_path = "/pride/data/archive/"
 
     # Create an instance of PRIDEUtility
-    pride_utility = PRIDEUtility(ftp_host, ftp_path)
-    dataset_paths = pride_utility.list_datasets()  # Populate dataset_paths dictionary
-
-    # Save dataset_paths to a local file (e.g., pickle)
-    with open("dataset_paths.pkl", "wb") as file:
-        pickle.dump(dataset_paths, file)
-    print("Dataset paths saved locally.")
-
-    # Exemplary data set 
-    dataset_id = "PRD000817"
-    success = pride_utility.download_dataset(dataset_id, file_format="mgf.gz")
-    if success:
-        print(f"Dataset {dataset_id} downloaded successfully.")
-    else:
-        print(f"Failed to download dataset {dataset_id}.")
+    with PRIDEUtility(ftp_host, ftp_path) as pride_utility:
+        dataset_paths = pride_utility.list_datasets()  # Populate dataset_paths dictionary
+
+        # Save dataset_paths to a local file (compressed pickle)
+        with gzip.open("dataset_paths.pkl.gz", "wb", compresslevel=3) as file:
+            pickle.dump(dataset_paths, file, protocol=pickle.HIGHEST_PROTOCOL)
+        print("Dataset paths saved locally.")
+
+        # Exemplary data set 
+        dataset_id = "PRD000817"
+        success = pride_utility.download_dataset(dataset_id, file_format="mgf.gz")
+        if success:
+            print(f"Dataset {dataset_id} downloaded successfully.")
+        else:
+            print(f"Failed to download dataset {dataset_id}.")
     
     # Write dataset list to a CSV file
     #csv_filename = "datasets_list.csv"